@@ -18,6 +18,7 @@ import random
 import warnings
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from multiprocessing import shared_memory
 from typing import Dict, List, Optional, Tuple
 
 import numpy as np
@@ -271,23 +272,130 @@ def make_txn_date(day: datetime) -> str:
 
 
 # =============================================================================
-# 8. TRANSACTION GENERATOR  (per-customer)
+# 8. PROFILE STORE  (array-backed, attachable from worker processes)
+# =============================================================================
+
+# Per-customer columns kept in the shared block, in layout order.
+# Gender / location / DOB are integer codes into small lookup tables (-1 = missing).
+_STORE_FIELDS: List[Tuple[str, str]] = [
+    ("avg_amount",       "float64"),
+    ("starting_balance", "float64"),
+    ("location_code",    "int32"),
+    ("dob_code",         "int32"),
+    ("gender_code",      "int8"),
+]
+
+
+def _store_layout(n: int, id_dtype: str) -> Tuple[List[Tuple[str, str, int]], int]:
+    """Byte offsets of each column in one contiguous block (8-byte aligned)."""
+    layout: List[Tuple[str, str, int]] = []
+    offset = 0
+    for name, dtype in [("customer_ids", id_dtype)] + _STORE_FIELDS:
+        layout.append((name, dtype, offset))
+        offset += -(-n * np.dtype(dtype).itemsize // 8) * 8
+    return layout, offset
+
+
+@dataclass
+class ProfileHandle:
+    """Picklable reference to a shared ProfileStore – this is all a worker receives."""
+    shm_name:  str
+    n:         int
+    id_dtype:  str
+    genders:   List[str]
+    locations: List[str]
+    dobs:      List[str]
+
+
+@dataclass
+class ProfileStore:
+    customer_ids:     np.ndarray   # fixed-width ASCII ("S" dtype)
+    avg_amount:       np.ndarray
+    starting_balance: np.ndarray
+    location_code:    np.ndarray
+    dob_code:         np.ndarray
+    gender_code:      np.ndarray
+    genders:          List[str]
+    locations:        List[str]
+    dobs:             List[str]
+
+    def __len__(self) -> int:
+        return len(self.customer_ids)
+
+    def customer_id(self, idx: int) -> str:
+        return self.customer_ids[idx].decode("ascii")
+
+    def gender(self, idx: int) -> Optional[str]:
+        code = int(self.gender_code[idx])
+        return self.genders[code] if code >= 0 else None
+
+    def location(self, idx: int) -> Optional[str]:
+        code = int(self.location_code[idx])
+        return self.locations[code] if code >= 0 else None
+
+    def dob(self, idx: int) -> Optional[str]:
+        code = int(self.dob_code[idx])
+        return self.dobs[code] if code >= 0 else None
+
+    def share(self) -> Tuple[shared_memory.SharedMemory, ProfileHandle]:
+        """
+        Copy the columns into a new shared-memory block.
+        The caller owns the block and must close() + unlink() it when done.
+        """
+        id_dtype     = self.customer_ids.dtype.str
+        layout, size = _store_layout(len(self), id_dtype)
+        shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        for name, dtype, offset in layout:
+            dst    = np.ndarray(len(self), dtype=dtype, buffer=shm.buf, offset=offset)
+            dst[:] = getattr(self, name)
+            del dst
+        handle = ProfileHandle(
+            shm.name, len(self), id_dtype, self.genders, self.locations, self.dobs,
+        )
+        return shm, handle
+
+    @classmethod
+    def attach(
+        cls, handle: ProfileHandle,
+    ) -> Tuple["ProfileStore", shared_memory.SharedMemory]:
+        """
+        Zero-copy view over a block created by share().
+        Drop the returned store before calling close() on the block.
+        """
+        shm       = shared_memory.SharedMemory(name=handle.shm_name)
+        layout, _ = _store_layout(handle.n, handle.id_dtype)
+        columns   = {
+            name: np.ndarray(handle.n, dtype=dtype, buffer=shm.buf, offset=offset)
+            for name, dtype, offset in layout
+        }
+        store = cls(
+            **columns,
+            genders   = handle.genders,
+            locations = handle.locations,
+            dobs      = handle.dobs,
+        )
+        return store, shm
+
+
+# =============================================================================
+# 9. TRANSACTION GENERATOR  (per-customer)
 # =============================================================================
 
 def generate_customer_transactions(
-    customer_id:   str,
-    profile:       dict,
+    store:         ProfileStore,
+    idx:           int,
     personality:   str,
     all_locations: List[str],
 ) -> List[dict]:
 
     cfg          = PERSONALITY_CONFIGS[personality]
-    amount_model = AmountModel(profile["avg_amount"], cfg)
-    balance      = BalanceTracker(profile["starting_balance"])
+    customer_id  = store.customer_id(idx)
+    amount_model = AmountModel(float(store.avg_amount[idx]), cfg)
+    balance      = BalanceTracker(store.starting_balance[idx])
 
-    dob         = profile["dob"]
-    gender      = profile["gender"]
-    current_loc = profile["location"]
+    dob         = store.dob(idx)
+    gender      = store.gender(idx)
+    current_loc = store.location(idx)
 
     # ── Activity window ──────────────────────────────────────────────────────
     start_date  = AUG_START
@@ -433,7 +541,7 @@ def generate_customer_transactions(
 
 
 # =============================================================================
-# 9. DATA LOADING & PROFILING
+# 10. DATA LOADING & PROFILING
 # =============================================================================
 
 def get_sql_connection():
@@ -467,7 +575,7 @@ def load_source_data() -> pd.DataFrame:
 
 def build_customer_profiles(
     df: pd.DataFrame,
-) -> Tuple[Dict[str, dict], List[str]]:
+) -> Tuple[ProfileStore, List[str]]:
 
     def _log_mean(x: pd.Series) -> float:
         pos = x[x > 0]
@@ -487,14 +595,30 @@ def build_customer_profiles(
     cap = agg["avg_amount"].quantile(0.99)
     agg["avg_amount"] = agg["avg_amount"].clip(upper=cap)
 
-    profiles      = agg.set_index("CustomerID").to_dict("index")
     all_locations = sorted(df["CustLocation"].dropna().unique().tolist())
 
-    return profiles, all_locations
+    # Location codes index straight into all_locations; gender / DOB get their own tables
+    gender_codes, genders = pd.factorize(agg["gender"])
+    dob_codes,    dobs    = pd.factorize(agg["dob"])
+    location_codes        = pd.Categorical(agg["location"], categories=all_locations).codes
+
+    store = ProfileStore(
+        customer_ids     = agg["CustomerID"].astype(str).to_numpy().astype("S"),
+        avg_amount       = agg["avg_amount"].to_numpy(dtype=np.float64),
+        starting_balance = agg["starting_balance"].to_numpy(dtype=np.float64),
+        location_code    = location_codes.astype(np.int32),
+        dob_code         = dob_codes.astype(np.int32),
+        gender_code      = gender_codes.astype(np.int8),
+        genders          = genders.tolist(),
+        locations        = all_locations,
+        dobs             = dobs.tolist(),
+    )
+
+    return store, all_locations
 
 
 # =============================================================================
-# 10. SQL WRITER
+# 11. SQL WRITER
 # =============================================================================
 
 _OUTPUT_COLS = [
@@ -527,11 +651,11 @@ def write_batch_to_sql(df: pd.DataFrame) -> None:
 
 
 # =============================================================================
-# 11. AUGMENTATION ORCHESTRATOR
+# 12. AUGMENTATION ORCHESTRATOR
 # =============================================================================
 
 def run_augmentation(
-    profiles:      Dict[str, dict],
+    store:         ProfileStore,
     all_locations: List[str],
 ) -> int:
 
@@ -539,22 +663,22 @@ def run_augmentation(
     print("  AUGMENTATION  v3.3  –  DW-Aligned Edition")
     print("=" * 68)
     print(f"  Window    : {AUG_START.date()}  →  {AUG_END.date()}")
-    print(f"  Customers : {len(profiles):,}")
+    print(f"  Customers : {len(store):,}")
     print(f"  Locations : {len(all_locations):,} unique")
     print(f"  Campaigns : {[d.strftime('%b-%Y') for d in CAMPAIGN_MONTHS]}")
 
     print("\n[1/4]  Assigning personalities …")
-    personalities: Dict[str, str] = {}
+    personalities: List[str] = []
     counts = {p: 0 for p in PERSONALITY_DIST}
-    for cid in tqdm(profiles, desc="  Assign", ncols=72):
-        p                  = assign_personality()
-        personalities[cid] = p
-        counts[p]         += 1
+    for _ in tqdm(range(len(store)), desc="  Assign", ncols=72):
+        p          = assign_personality()
+        personalities.append(p)
+        counts[p] += 1
 
     print("\n  Distribution:")
     for p, n in counts.items():
-        bar = "█" * int(n / len(profiles) * 36)
-        print(f"    {p:15s}  {n:7,}  ({n/len(profiles)*100:4.1f}%)  {bar}")
+        bar = "█" * int(n / len(store) * 36)
+        print(f"    {p:15s}  {n:7,}  ({n/len(store)*100:4.1f}%)  {bar}")
 
     print("\n[2/4]  Truncating SQL table …")
     conn   = get_sql_connection()
@@ -565,20 +689,20 @@ def run_augmentation(
     conn.close()
     print("  ✓ Done")
 
-    all_ids    = list(profiles.keys())
-    n_batches  = -(-len(all_ids) // CUSTOMER_BATCH_SIZE)
-    total_txns = 0
+    n_customers = len(store)
+    n_batches   = -(-n_customers // CUSTOMER_BATCH_SIZE)
+    total_txns  = 0
 
     print(f"\n[3/4]  Generating  (batch = {CUSTOMER_BATCH_SIZE:,} customers) …")
-    for b_idx, start in enumerate(range(0, len(all_ids), CUSTOMER_BATCH_SIZE)):
-        batch_ids  = all_ids[start : start + CUSTOMER_BATCH_SIZE]
+    for b_idx, start in enumerate(range(0, n_customers, CUSTOMER_BATCH_SIZE)):
+        stop       = min(start + CUSTOMER_BATCH_SIZE, n_customers)
         batch_rows: List[dict] = []
 
-        print(f"\n  Batch {b_idx+1}/{n_batches}  –  customers {start:,}–{start+len(batch_ids):,}")
-        for cid in tqdm(batch_ids, desc="  Generate", leave=False, ncols=72):
+        print(f"\n  Batch {b_idx+1}/{n_batches}  –  customers {start:,}–{stop:,}")
+        for idx in tqdm(range(start, stop), desc="  Generate", leave=False, ncols=72):
             batch_rows.extend(
                 generate_customer_transactions(
-                    cid, profiles[cid], personalities[cid], all_locations
+                    store, idx, personalities[idx], all_locations
                 )
             )
 
@@ -595,7 +719,7 @@ def run_augmentation(
 
 
 # =============================================================================
-# 12. VERIFICATION
+# 13. VERIFICATION
 # =============================================================================
 
 def verify_output() -> None:
@@ -629,7 +753,7 @@ def verify_output() -> None:
 
 
 # =============================================================================
-# 13. ENTRY POINT
+# 14. ENTRY POINT
 # =============================================================================
 
 if __name__ == "__main__":
@@ -643,11 +767,11 @@ if __name__ == "__main__":
     try:
         print("\n[Loading seed data]")
         df_seed              = load_source_data()
-        profiles, all_locs   = build_customer_profiles(df_seed)
+        store, all_locs      = build_customer_profiles(df_seed)
         del df_seed
         gc.collect()
 
-        total = run_augmentation(profiles, all_locs)
+        total = run_augmentation(store, all_locs)
         verify_output()
 
         print("\n" + "=" * 68)